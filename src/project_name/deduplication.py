@@ -0,0 +1,216 @@
+import itertools
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import ijson
+import numpy as np
+import orjson
+import xxhash
+from rensa import RMinHash
+
+NUM_PERM = 128
+NUM_BANDS = 16
+BAND_SIZE = NUM_PERM // NUM_BANDS
+BAND_BYTES = BAND_SIZE * 4  # uint32 signatures
+MINHASH_SEED = 1
+SHINGLE_SIZE = 5
+
+
+class BandedMinHashLSH:
+    """LSH index over uint32[NUM_PERM] MinHash signatures.
+
+    Replaces datasketch.MinHashLSH: signatures are split into NUM_BANDS bands
+    of BAND_SIZE permutations, each band keyed by its raw bytes and looked
+    up in a plain dict, so queries and inserts are dict operations instead of
+    per-band Python iteration inside datasketch. The 16x8 banding matches a
+    similarity threshold of ~0.9.
+    """
+
+    def __init__(self):
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(NUM_BANDS)]
+
+    def _band_keys(self, signature):
+        signature_bytes = signature.tobytes()
+        band_keys = []
+        for band in range(NUM_BANDS):
+            start = band * BAND_BYTES
+            end = start + BAND_BYTES
+            band_keys.append(signature_bytes[start:end])
+        return band_keys
+
+    def query(self, signature):
+        """Return True if any band of `signature` collides with an inserted one."""
+        for bucket, band_key in zip(self._buckets, self._band_keys(signature)):
+            if band_key in bucket:
+                return True
+        return False
+
+    def insert(self, key, signature):
+        for bucket, band_key in zip(self._buckets, self._band_keys(signature)):
+            bucket.setdefault(band_key, []).append(key)
+
+    def insert_if_unique(self, key, signature):
+        """Insert `signature` unless it collides; returns True when inserted.
+
+        Fuses query and insert so the band keys are computed once per entry
+        instead of twice on the hot path.
+        """
+        band_keys = self._band_keys(signature)
+        for bucket, band_key in zip(self._buckets, band_keys):
+            if band_key in bucket:
+                return False
+        for bucket, band_key in zip(self._buckets, band_keys):
+            bucket.setdefault(band_key, []).append(key)
+        return True
+
+
+def minhash_signature(paragraphs):
+    """Compute the uint32[NUM_PERM] MinHash signature of a list of paragraphs."""
+    minhash = RMinHash(num_perm=NUM_PERM, seed=MINHASH_SEED)
+    minhash.update(paragraphs)
+    return np.asarray(minhash.digest(), dtype=np.uint32)
+
+
+def _shingles(text):
+    """Character SHINGLE_SIZE-gram shingles of one paragraph."""
+    if len(text) <= SHINGLE_SIZE:
+        return {text} if text else set()
+    shingles = set()
+    for start in range(len(text) - SHINGLE_SIZE + 1):
+        end = start + SHINGLE_SIZE
+        shingles.add(text[start:end])
+    return shingles
+
+
+def _entry_signature(entry):
+    shingles = set()
+    for paragraph in entry["source"].split("\n"):
+        shingles.update(_shingles(paragraph))
+    return minhash_signature(list(shingles))
+
+
+def create_deduplicated_chunk(chunk, lsh, exact_hashes, start_idx):
+    """Deduplicate one chunk of entries against the shared LSH index.
+
+    Entries whose full source text was seen before (64-bit xxhash in
+    `exact_hashes`) are dropped without any MinHash work; only first
+    occurrences go through signature construction and the LSH. Signature
+    construction is independent per entry and runs in rensa's Rust code, so
+    it is spread over a thread pool; the LSH query/insert phase stays serial
+    for correctness.
+    """
+    fresh_entries = []
+    fresh_keys = []
+    for idx, entry in enumerate(chunk):
+        content_hash = xxhash.xxh64_intdigest(entry["source"].encode("utf-8"))
+        if content_hash in exact_hashes:
+            continue
+        exact_hashes.add(content_hash)
+        fresh_entries.append(entry)
+        fresh_keys.append(start_idx + idx)
+
+    with ThreadPoolExecutor() as pool:
+        signatures = list(pool.map(_entry_signature, fresh_entries, chunksize=64))
+
+    deduplicated_chunk = []
+    for key, entry, signature in zip(fresh_keys, fresh_entries, signatures):
+        if lsh.insert_if_unique(key, signature):
+            deduplicated_chunk.append(entry)
+    return deduplicated_chunk
+
+
+def iter_entries(input_file):
+    """Yield entries of a JSON array file one at a time without loading it all."""
+    with open(input_file, "rb") as f:
+        yield from ijson.items(f, "item")
+
+
+def save_checkpoint(entries, output_file, mode="w"):
+    """Append deduplicated entries to a JSONL file ('w' truncates first)."""
+    open_mode = "ab" if mode == "a" else "wb"
+    with open(output_file, open_mode) as f:
+        if entries:
+            f.write(b"\n".join(orjson.dumps(entry) for entry in entries) + b"\n")
+
+
+def _lsh_state_file(output_file):
+    return output_file + ".lsh.pkl"
+
+
+def save_lsh_state(lsh, exact_hashes, processed_rows, output_file):
+    """Persist the dedup state and row counter next to the checkpoint file."""
+    with open(_lsh_state_file(output_file), "wb") as f:
+        pickle.dump(
+            {
+                "lsh": lsh,
+                "exact_hashes": exact_hashes,
+                "processed_rows": processed_rows,
+            },
+            f,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+
+
+def process_in_batches(
+    input_file, output_file, chunk_size=10000, checkpoint_interval=5
+):
+    """Deduplicate `input_file` chunk by chunk, checkpointing to `output_file`."""
+    output_dir = os.path.dirname(output_file)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    lsh = BandedMinHashLSH()
+    exact_hashes = set()
+
+    processed_rows = 0
+    state_file = _lsh_state_file(output_file)
+    if os.path.exists(state_file):
+        with open(state_file, "rb") as f:
+            state = pickle.load(f)
+        lsh = state["lsh"]
+        exact_hashes = state["exact_hashes"]
+        processed_rows = state["processed_rows"]
+        print(f"Resuming: loaded LSH state after {processed_rows} processed rows")
+    elif os.path.exists(output_file):
+        # No sidecar (old checkpoint): rebuild the LSH by re-hashing the output.
+        with open(output_file, "rb") as f:
+            previous_entries = [orjson.loads(line) for line in f if line.strip()]
+        create_deduplicated_chunk(previous_entries, lsh, exact_hashes, 0)
+        processed_rows = len(previous_entries)
+        print(
+            f"Resuming: rebuilt index from {processed_rows} previously written entries"
+        )
+
+    entries = iter_entries(input_file)
+    # Skip rows already handled by a previous run.
+    next(itertools.islice(entries, processed_rows, processed_rows), None)
+
+    pending_entries = []
+    batch_num = 0
+    chunk_start = processed_rows
+    while True:
+        chunk = list(itertools.islice(entries, chunk_size))
+        if not chunk:
+            break
+        pending_entries.extend(
+            create_deduplicated_chunk(chunk, lsh, exact_hashes, chunk_start)
+        )
+        chunk_start += len(chunk)
+        batch_num += 1
+        if batch_num % checkpoint_interval == 0:
+            save_checkpoint(pending_entries, output_file, mode="a")
+            save_lsh_state(lsh, exact_hashes, chunk_start, output_file)
+            pending_entries = []
+        print(f"Processed {chunk_start} rows")
+
+    if pending_entries:
+        save_checkpoint(pending_entries, output_file, mode="a")
+    save_lsh_state(lsh, exact_hashes, chunk_start, output_file)
+
+
+if __name__ == "__main__":
+    input_file = "data/input/tibetan_sentences.json"
+    output_file = "data/output/deduplicated_sentences.jsonl"
+    process_in_batches(input_file, output_file)
@@ -0,0 +1,13 @@
+from datasets import Dataset, DatasetDict
+
+HUB_REPO_ID = "Jimpa2000/tibetan-sentences-deduplicated"
+
+
+def push_to_hub(json_file):
+    """Load a deduplicated JSONL checkpoint into Arrow and push it to the Hub."""
+    dataset = Dataset.from_json(json_file)
+    DatasetDict({"train": dataset}).push_to_hub(HUB_REPO_ID)
+
+
+if __name__ == "__main__":
+    push_to_hub("data/output/deduplicated_sentences.jsonl")
@@ -0,0 +1,167 @@
+import json
+import os
+from multiprocessing import Pool
+
+import numpy as np
+import orjson
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional speedup; fall back to pure Python
+    njit = None  # type: ignore[assignment]
+
+SENT_BR = "<sent_br>"
+SENT_BR_BYTES = SENT_BR.encode("utf-8")
+SENT_BR_CODEPOINTS = np.frombuffer(SENT_BR.encode("utf-32-le"), dtype=np.uint32)
+NEWLINE_CODEPOINT = ord("\n")
+
+
+def manhattan_distance(str1, str2):
+    """Count the positions at which two equal-length strings differ."""
+    if len(str1) != len(str2):
+        return max(len(str1), len(str2))
+    codepoints1 = np.frombuffer(str1.encode("utf-32-le"), dtype=np.uint32)
+    codepoints2 = np.frombuffer(str2.encode("utf-32-le"), dtype=np.uint32)
+    return int(np.count_nonzero(codepoints1 != codepoints2))
+
+
+def strings_equal(str1, str2):
+    """Equality check for the hot path; CPython's memcmp exits at the first mismatch."""
+    return str1 == str2
+
+
+def _codepoints(text):
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+
+def _validate_kernel(source_cp, target_cp, sent_br_cp):
+    """State machine over codepoint arrays; compiled with numba when available.
+
+    Equivalent to _validate_python but compares eagerly instead of building a
+    reconstructed string: any character mismatch or leftover source fails.
+    """
+    n_src = source_cp.shape[0]
+    n_tgt = target_cp.shape[0]
+    tag_len = sent_br_cp.shape[0]
+    src_idx = 0
+    tgt_idx = 0
+    while tgt_idx < n_tgt:
+        is_tag = tgt_idx + tag_len <= n_tgt
+        if is_tag:
+            for k in range(tag_len):
+                if target_cp[tgt_idx + k] != sent_br_cp[k]:
+                    is_tag = False
+                    break
+        if is_tag:
+            if src_idx < n_src and source_cp[src_idx] == NEWLINE_CODEPOINT:
+                src_idx += 1
+            tgt_idx += tag_len
+        else:
+            if src_idx >= n_src or source_cp[src_idx] != target_cp[tgt_idx]:
+                return False
+            src_idx += 1
+            tgt_idx += 1
+    return src_idx == n_src
+
+
+if njit is not None:
+    _validate_kernel = njit(boundscheck=False, cache=True)(_validate_kernel)
+
+
+def _validate_python(source_no_spaces, target_no_spaces):
+    """Pure-Python validation used when numba is not installed.
+
+    Works on utf-8 bytes: the tag and the newline are ASCII, so byte-level
+    scanning is safe and avoids per-character str object dispatch.
+    """
+    source_b = source_no_spaces.encode("utf-8")
+    target_b = target_no_spaces.encode("utf-8")
+    reconstructed = bytearray()
+    src_idx = 0
+    tgt_idx = 0
+    while tgt_idx < len(target_b):
+        tag_pos = target_b.find(SENT_BR_BYTES, tgt_idx)
+        if tag_pos < 0:
+            tag_pos = len(target_b)
+        reconstructed += target_b[tgt_idx:tag_pos]
+        src_idx += tag_pos - tgt_idx
+        if tag_pos == len(target_b):
+            break
+        if src_idx < len(source_b) and source_b[src_idx] == NEWLINE_CODEPOINT:
+            reconstructed += b"\n"
+            src_idx += 1
+        tgt_idx = tag_pos + len(SENT_BR_BYTES)
+
+    # bytearray == bytes compares contents, so no final bytes() copy is needed.
+    return strings_equal(reconstructed, source_b)
+
+
+def replace_sentence_breaks_and_validate(data_point):
+    """Check that the target's <sent_br> markup is consistent with the source.
+
+    Walks the target string, mapping each <sent_br> tag to a newline in the
+    source (or to nothing when the source has none at that position), and
+    validates that the reconstructed target matches the source exactly.
+    Spaces are ignored on both sides.
+    """
+    source_no_spaces = data_point["source"].replace(" ", "")
+    target_no_spaces = data_point["target"].replace(" ", "")
+    if njit is None:
+        return _validate_python(source_no_spaces, target_no_spaces)
+    return bool(
+        _validate_kernel(
+            _codepoints(source_no_spaces),
+            _codepoints(target_no_spaces),
+            SENT_BR_CODEPOINTS,
+        )
+    )
+
+
+def _validate_line(line):
+    """Parse and validate one JSONL line; returns (is_valid, data_point) or None."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        data_point = orjson.loads(line)
+    except orjson.JSONDecodeError:
+        return None
+    return replace_sentence_breaks_and_validate(data_point), data_point
+
+
+def process_tibetan_sentences(input_file, valid_output_file, invalid_output_file):
+    """Split the data points of a JSONL input file into valid and invalid sets.
+
+    Validation of each data point is independent and pure CPU, so lines are
+    fanned out to a process pool; ordering of the output lists is therefore
+    not guaranteed.
+    """
+    valid_data_points = []
+    invalid_data_points = []
+    with open(input_file, encoding="utf-8") as infile, Pool() as pool:
+        for result in pool.imap_unordered(_validate_line, infile, chunksize=2048):
+            if result is None:
+                continue
+            is_valid, data_point = result
+            if is_valid:
+                valid_data_points.append(data_point)
+            else:
+                invalid_data_points.append(data_point)
+
+    for output_file, data_points in (
+        (valid_output_file, valid_data_points),
+        (invalid_output_file, invalid_data_points),
+    ):
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(data_points, f, ensure_ascii=False, indent=4)
+
+
+if __name__ == "__main__":
+    input_file = "data/input/tibetan_sentences.jsonl"
+    output_dir = "data/output"
+    os.makedirs(output_dir, exist_ok=True)
+    process_tibetan_sentences(
+        input_file,
+        os.path.join(output_dir, "valid_sentences.json"),
+        os.path.join(output_dir, "invalid_sentences.json"),
+    )
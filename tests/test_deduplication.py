@@ -0,0 +1,28 @@
+from project_name.deduplication import BandedMinHashLSH, create_deduplicated_chunk
+
+
+def test_create_deduplicated_chunk_drops_duplicates():
+    chunk = [
+        {"source": "བཀྲ་ཤིས་བདེ་ལེགས།\nཐུགས་རྗེ་ཆེ།", "target": "a"},
+        {"source": "བཀྲ་ཤིས་བདེ་ལེགས།\nཐུགས་རྗེ་ཆེ།", "target": "b"},
+        {"source": "སྐུ་ཁམས་བཟང་པོ་ཡིན་པས།\nདེ་རིང་གནམ་གཤིས་ཡག་པོ་འདུག", "target": "c"},
+    ]
+    lsh = BandedMinHashLSH()
+    deduplicated = create_deduplicated_chunk(chunk, lsh, set(), 0)
+    assert [entry["target"] for entry in deduplicated] == ["a", "c"]
+
+
+def test_create_deduplicated_chunk_drops_near_duplicates():
+    # A one-character edit defeats the exact-hash screen, so this entry can
+    # only be dropped through the shingle/MinHash/LSH path.
+    base = "བོད་ཀྱི་ལོ་རྒྱུས་ནང་དུ་སྔོན་མ་བྱུང་བའི་གནས་ཚུལ་མང་པོ་ཞིག་འཁོད་ཡོད། " * 8
+    near_duplicate = base.replace("ལོ་རྒྱུས", "ལོ་རྒྱུད", 1)
+    dissimilar = "དེ་རིང་གནམ་གཤིས་ཡག་པོ་འདུག་པས་ང་ཚོ་ཕྱི་ལོགས་སུ་འགྲོ་རྒྱུ་ཡིན། " * 8
+    chunk = [
+        {"source": base, "target": "a"},
+        {"source": near_duplicate, "target": "b"},
+        {"source": dissimilar, "target": "c"},
+    ]
+    lsh = BandedMinHashLSH()
+    deduplicated = create_deduplicated_chunk(chunk, lsh, set(), 0)
+    assert [entry["target"] for entry in deduplicated] == ["a", "c"]
@@ -0,0 +1,47 @@
+import pytest
+
+from project_name.sentence_validation import (
+    _validate_python,
+    manhattan_distance,
+    replace_sentence_breaks_and_validate,
+)
+
+# (source, target, expected) triples shared by both validator paths.
+VALIDATION_CASES = [
+    (
+        "བཀྲ་ཤིས་བདེ་ལེགས།\nཐུགས་རྗེ་ཆེ།",
+        "བཀྲ་ཤིས་བདེ་ལེགས།<sent_br>ཐུགས་རྗེ་ཆེ།",
+        True,
+    ),
+    (
+        "བཀྲ་ཤིས་བདེ་ལེགས།ཐུགས་རྗེ་ཆེ།",
+        "བཀྲ་ཤིས་བདེ་ལེགས།<sent_br>ཐུགས་རྗེ་ཆེ།",
+        True,
+    ),
+    (
+        "བཀྲ་ཤིས་བདེ་ལེགས།",
+        "ཐུགས་རྗེ་ཆེ།<sent_br>",
+        False,
+    ),
+]
+
+
+def test_manhattan_distance():
+    assert manhattan_distance("བཀྲ་ཤིས", "བཀྲ་ཤིས") == 0
+    assert manhattan_distance("བཀྲ་ཤིས", "བཀྲ་ཞིས") == 1
+    assert manhattan_distance("བཀྲ", "བཀྲ་ཤིས") == 7
+
+
+@pytest.mark.parametrize("source,target,expected", VALIDATION_CASES)
+def test_replace_sentence_breaks_and_validate(source, target, expected):
+    data_point = {"source": source, "target": target}
+    assert replace_sentence_breaks_and_validate(data_point) == expected
+
+
+@pytest.mark.parametrize("source,target,expected", VALIDATION_CASES)
+def test_validate_python_fallback(source, target, expected):
+    # The dispatcher prefers the numba kernel when installed; exercise the
+    # pure-Python path directly so both implementations stay covered.
+    source_no_spaces = source.replace(" ", "")
+    target_no_spaces = target.replace(" ", "")
+    assert _validate_python(source_no_spaces, target_no_spaces) == expected